@@ -0,0 +1,2 @@
+# Placing conftest.py at the repository root makes pytest add this directory to sys.path,
+# so tests can import the core and strategies packages when run as plain `pytest`.
@@ -1,10 +1,57 @@
-import vectorbt as vbt
+import asyncio
+import aiohttp
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from pathlib import Path
 from binance.client import Client
 import os
+import shutil
 import time
 
+BINANCE_API_URL = "https://api.binance.com"
+KLINES_LIMIT = 1000  # max klines per /api/v3/klines request
+MAX_CONCURRENT_DOWNLOADS = 10
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+TICKERS_CACHE_TTL = 3600  # seconds to reuse the cached /api/v3/ticker/24hr response
+SUCCESS_MARKER = '_SUCCESS'  # lists the saved symbols; written last, skipped by parquet readers
+REQUESTS_PER_SECOND = 18  # stays under Binance's 1200 requests/min IP limit
+
+class RateLimiter:
+    """Sliding-window rate limiter: allows at most `rate` acquisitions in any `per` seconds.
+    Bursts up to `rate` go through immediately; further callers wait for the oldest slot to expire.
+    After block() every caller waits until the block expires."""
+    def __init__(self, rate: int = REQUESTS_PER_SECOND, per: float = 1.0):
+        self.rate = rate
+        self.per = per
+        self._timestamps = deque()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def block(self, seconds: float) -> None:
+        """Hold back all callers for the given number of seconds, e.g. a 429 Retry-After."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent and record it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                while self._timestamps and now - self._timestamps[0] >= self.per:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.rate:
+                    self._timestamps.append(now)
+                    return
+                await asyncio.sleep(self.per - (now - self._timestamps[0]))
+
 class DataLoader:
     def __init__(
             self, 
@@ -23,35 +70,67 @@ class DataLoader:
         self.top_n = top_n
         self.top_btc_pairs = []
 
-    def get_top_liquid_pairs(self) -> list[str]:
-        """Receive n number of most liquid pairs with BTC for last 24h."""
-        tickers = self.client.get_ticker()  # 24-hour price change statistics
-        btc_pairs = [t for t in tickers if t['symbol'].endswith('BTC')]
-        btc_pairs_sorted = sorted(btc_pairs, key=lambda x: float(x['quoteVolume']), reverse=True)
-        self.top_btc_pairs = [p['symbol'] for p in btc_pairs_sorted[:self.top_n]]
+    def get_top_liquid_pairs(self, refresh: bool = False) -> list[str]:
+        """Receive n number of most liquid pairs with BTC for last 24h.
+        If refresh is True, bypass the cached ticker statistics."""
+        tickers = self._get_tickers(refresh)  # 24-hour price change statistics
+        symbols = np.array([t['symbol'] for t in tickers], dtype=str)
+        volumes = np.array([t['quoteVolume'] for t in tickers], dtype=np.float64)
+        btc_mask = np.char.endswith(symbols, 'BTC')
+        btc_symbols, btc_volumes = symbols[btc_mask], volumes[btc_mask]
+
+        # Select the top n in O(N) and sort only those, instead of sorting every BTC pair
+        n = min(self.top_n, len(btc_symbols))
+        top = np.argpartition(-btc_volumes, n - 1)[:n] if n else np.array([], dtype=np.intp)
+        top = top[np.argsort(-btc_volumes[top], kind='stable')]
+        self.top_btc_pairs = btc_symbols[top].tolist()
         print(f"Top {self.top_n} pairs: {self.top_btc_pairs[:5]}...")
         return self.top_btc_pairs
 
+    def _get_tickers(self, refresh: bool = False) -> list[dict]:
+        """Return the 24h ticker statistics of all pairs.
+        The response is cached in data_dir/tickers.json and reused for TICKERS_CACHE_TTL seconds,
+        unless refresh is True."""
+        cache_path = self.data_dir / 'tickers.json'
+        if not refresh and cache_path.is_file() and time.time() - cache_path.stat().st_mtime < TICKERS_CACHE_TTL:
+            return json.loads(cache_path.read_text())
+        tickers = self.client.get_ticker()
+        cache_path.write_text(json.dumps(tickers))
+        return tickers
+
     def is_data_valid(self, path: Path) -> bool:
-        """Check if a parquet file exists and contains valid OHLCV data."""
+        """Check if a parquet dataset is complete and contains valid OHLCV data.
+        A complete dataset carries the SUCCESS_MARKER written after all downloads finished.
+        Only the parquet footers are read: the schema for the columns and the row counts for emptiness."""
         try:
-            if not path.exists():
+            if not (path / SUCCESS_MARKER).is_file():
                 return False
-            df = pd.read_parquet(path)
-            required_cols = {'Open', 'High', 'Low', 'Close', 'Volume'}
-            if df.empty or not required_cols.issubset(df.columns):
+            dataset = ds.dataset(path, format='parquet', partitioning='hive')
+            if not set(OHLCV_COLUMNS).issubset(dataset.schema.names):
                 return False
-            return True
+            return dataset.count_rows() > 0
         except Exception as e:
             print(f"Validation failed for {path.name}: {e}")
             return False
 
     def download_data(self, refresh: bool = False) -> None:
         """Download historical 1-minute OHLCV data for the top BTC pairs
-        If refresh is True, delete all cached files and reload from scratch."""
+        If refresh is True, delete all cached files and reload from scratch.
+        Inside a running event loop (e.g. Jupyter) the download runs on its own loop in a worker
+        thread and blocks the caller; prefer `await adownload_data()` there."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.adownload_data(refresh))
+            return
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(asyncio.run, self.adownload_data(refresh)).result()
+
+    async def adownload_data(self, refresh: bool = False) -> None:
+        """Async version of download_data for callers that already run an event loop."""
         if not self.top_btc_pairs:
             print("Fetching top BTC pairs...")
-            self.get_top_liquid_pairs()
+            self.get_top_liquid_pairs(refresh)
 
         combined_path = self.data_dir / f"btc_{self.interval}_{self.date_start.replace('-', '')}.parquet"
         
@@ -59,51 +138,155 @@ class DataLoader:
             print("Refreshing: removing all cached parquet files...")
             for file in self.data_dir.glob("*.parquet"):
                 try:
-                    file.unlink()
+                    if file.is_dir():
+                        shutil.rmtree(file)
+                    else:
+                        file.unlink()
                     print(f"Deleted: {file.name}")
                 except Exception as e:
                     print(f"Failed to delete {file.name}: {e}")
 
-        all_dfs = []
-        
         if not refresh and self.is_data_valid(combined_path):
             print(f"Combined data is valid and cached: {combined_path}")
         else:
-            for i, symbol in enumerate(self.top_btc_pairs, 1):
-                print(f"\n[{i}/{len(self.top_btc_pairs)}] Downloading {symbol}...")
-                try:
-                    df = vbt.BinanceData.download_symbol(
-                        symbol=symbol,
-                        client=self.client,
-                        interval=self.interval,
-                        start=self.date_start,
-                        end=self.date_end,
-                        delay=500,
-                        show_progress=False
-                    )
-                    df['symbol'] = symbol
-                    all_dfs.append(df)
-                    print(f"Data for {symbol} downloaded successfully.")
-                    time.sleep(0.5)  
-                except Exception as e:
-                    print(f"Error with {symbol}: {e}")
-                    continue
+            # Partitions go to a temporary sibling and are moved into place only once every
+            # download has finished, so an interrupted run never leaves a partial dataset behind
+            tmp_path = combined_path.with_suffix('.parquet.tmp')
+            if tmp_path.exists():
+                shutil.rmtree(tmp_path)
+            saved = await self._download_all(tmp_path)
+
+            if saved:
+                (tmp_path / SUCCESS_MARKER).write_text(json.dumps(saved))
+                # Drop a dataset this run replaces, or a single-file dataset from an older version
+                if combined_path.is_dir():
+                    shutil.rmtree(combined_path)
+                elif combined_path.exists():
+                    combined_path.unlink()
+                os.replace(tmp_path, combined_path)
+                print(f"\nCombined OHLCV dataset saved: {combined_path} ({len(saved)} pairs)")
+            elif tmp_path.exists():
+                shutil.rmtree(tmp_path)
+
+    async def _download_all(self, root_path: Path) -> list[str]:
+        """Download all top BTC pairs concurrently, at most MAX_CONCURRENT_DOWNLOADS at a time,
+        writing each pair to its own symbol=<SYMBOL> partition under root_path as soon as it arrives.
+        Returns the symbols of successfully saved pairs."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+        limiter = RateLimiter()
+        async with aiohttp.ClientSession() as session:
+            results = await asyncio.gather(
+                *[
+                    self._download_symbol(session, semaphore, limiter, symbol, root_path)
+                    for symbol in self.top_btc_pairs
+                ],
+                return_exceptions=True
+            )
+
+        saved = []
+        for symbol, result in zip(self.top_btc_pairs, results):
+            if isinstance(result, BaseException):
+                print(f"Error with {symbol}: {result}")
+                continue
+            saved.append(symbol)
+        return saved
+
+    async def _download_symbol(
+            self,
+            session: aiohttp.ClientSession,
+            semaphore: asyncio.Semaphore,
+            limiter: RateLimiter,
+            symbol: str,
+            root_path: Path
+        ) -> None:
+        """Download OHLCV klines for one symbol and write them to its partition of the dataset.
+        The write runs in a worker thread so other downloads keep going."""
+        df = await self._fetch_symbol(session, semaphore, limiter, symbol)
+        await asyncio.to_thread(self._write_partition, df, symbol, root_path)
+
+    def _write_partition(self, df: pd.DataFrame, symbol: str, root_path: Path) -> None:
+        """Write the OHLCV frame of one symbol to root_path/symbol=<SYMBOL>/ as zstd parquet."""
+        table = pa.Table.from_pandas(df.assign(symbol=symbol))
+        pq.write_to_dataset(
+            table,
+            root_path=root_path,
+            partition_cols=['symbol'],
+            basename_template='part-{i}.parquet',
+            existing_data_behavior='delete_matching',
+            compression='zstd',
+            compression_level=3,
+            row_group_size=100_000
+        )
+
+    async def _fetch_symbol(
+            self,
+            session: aiohttp.ClientSession,
+            semaphore: asyncio.Semaphore,
+            limiter: RateLimiter,
+            symbol: str
+        ) -> pd.DataFrame:
+        """Download OHLCV klines for one symbol, paginating /api/v3/klines by startTime.
+        Every request first takes a slot from the shared limiter.
+        On HTTP 429 blocks the limiter for the Retry-After interval, so all downloads back off,
+        and repeats the request."""
+        start_ms = int(pd.Timestamp(self.date_start, tz='UTC').timestamp() * 1000)
+        end_ms = int(pd.Timestamp(self.date_end, tz='UTC').timestamp() * 1000) - 1
+        klines = []
+
+        async with semaphore:
+            print(f"Downloading {symbol}...")
+            while start_ms <= end_ms:
+                params = {
+                    'symbol': symbol,
+                    'interval': self.interval,
+                    'startTime': start_ms,
+                    'endTime': end_ms,
+                    'limit': KLINES_LIMIT
+                }
+                await limiter.acquire()
+                async with session.get(f"{BINANCE_API_URL}/api/v3/klines", params=params) as response:
+                    if response.status == 429:
+                        retry_after = float(response.headers.get('Retry-After', 1))
+                        print(f"Rate limit hit for {symbol}, pausing all downloads for {retry_after}s...")
+                        limiter.block(retry_after)
+                        continue
+                    response.raise_for_status()
+                    page = await response.json()
+
+                if not page:
+                    break
+                klines.extend(page)
+                start_ms = page[-1][0] + 1
+                if len(page) < KLINES_LIMIT:
+                    break
+
+        if not klines:
+            raise ValueError(f"No data returned for {symbol}")
+
+        # Kline fields: open time, open, high, low, close, volume, ...
+        data = np.array([k[:6] for k in klines], dtype=np.float64)
+        index = pd.to_datetime(data[:, 0].astype(np.int64), unit='ms', utc=True).rename('Open time')
+        df = pd.DataFrame(data[:, 1:], index=index, columns=OHLCV_COLUMNS)
+        print(f"Data for {symbol} downloaded successfully.")
+        return df
 
-            if all_dfs:
-                combined_df = pd.concat(all_dfs)  
-                ohlcv_columns = ['Open', 'High', 'Low', 'Close', 'Volume', 'symbol']
-                if not all(col in combined_df.columns for col in ohlcv_columns):
-                    print(f"Warning: Not all expected OHLCV columns found. Available columns: {combined_df.columns}")
-                combined_df = combined_df[ohlcv_columns]
-
-                combined_df.to_parquet(combined_path, compression='snappy')
-                print(f"\nCombined OHLCV dataset saved: {combined_path}")
-                
-    def load_parquet(self, filename: str) -> pd.DataFrame:
-        """Loads data from a .parquet."""
+    def load_parquet(self, filename: str, symbol: str | None = None) -> pd.DataFrame:
+        """Loads data from a .parquet dataset, memory-mapping its files, with OHLCV as float32.
+        If symbol is given, only that pair's partition is read."""
         if not filename.endswith('.parquet'):
             raise ValueError("Filename must end with .parquet")
         if not (self.data_dir / filename).exists():
             raise FileNotFoundError(f"{filename} does not exist in {self.data_dir}")
-        pd.set_option('display.max_rows', None)
-        return pd.read_parquet(self.data_dir / filename)
\ No newline at end of file
+        filters = [('symbol', '=', symbol)] if symbol is not None else None
+        table = pq.read_table(self.data_dir / filename, filters=filters, memory_map=True, use_threads=True)
+        # Cast in Arrow so no float64 pandas frame is ever built. float32 only halves the resident
+        # memory of the loaded frame: the strategies upcast Close and Volume to float64 before their
+        # rolling kernels, because bottleneck's running sums lose precision in float32
+        table = table.cast(pa.schema(
+            [field.with_type(pa.float32()) if field.name in OHLCV_COLUMNS else field for field in table.schema],
+            metadata=table.schema.metadata
+        ))
+        # Every partition file and row group arrives as its own chunk; merge them into one buffer per column
+        table = table.combine_chunks()
+        # self_destruct releases each Arrow column as soon as its pandas block is built
+        return table.to_pandas(self_destruct=True, split_blocks=True)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from functools import cached_property
 import pandas as pd
 
 class StrategyBase(ABC):
@@ -10,6 +11,30 @@ class StrategyBase(ABC):
         """
         self.price_data = price_data
 
+    def __setattr__(self, name, value):
+        """
+        Sets an attribute. Assigning the price data or any strategy parameter (any public
+        attribute) invalidates the cached signals and backtest results.
+        """
+        super().__setattr__(name, value)
+        if not name.startswith('_'):
+            self.__dict__.pop('_signals_df', None)
+            self.__dict__.pop('_backtest_df', None)
+
+    @cached_property
+    def _signals_df(self) -> pd.DataFrame:
+        """
+        Signals produced by generate_signals, computed once for the current parameters.
+        """
+        return self.generate_signals()
+
+    @cached_property
+    def _backtest_df(self):
+        """
+        Backtest results produced by _run_backtest, computed once for the current parameters.
+        """
+        return self._run_backtest()
+
     @abstractmethod
     def generate_signals(self) -> pd.DataFrame:
         """
@@ -19,10 +44,21 @@ class StrategyBase(ABC):
         """
         pass
 
-    @abstractmethod
     def run_backtest(self) -> pd.DataFrame:
         """
-        Runs the backtest on the strategy.
+        Runs the backtest on the strategy. The result is cached and shared with get_metrics
+        until the price data or a parameter changes; DataFrame results are returned as a copy,
+        so changing them does not affect get_metrics.
+
+        :return: DataFrame containing backtest results
+        """
+        backtest = self._backtest_df
+        return backtest.copy() if isinstance(backtest, pd.DataFrame) else backtest
+
+    @abstractmethod
+    def _run_backtest(self) -> pd.DataFrame:
+        """
+        Computes the backtest from the cached signals in self._signals_df.
 
         :return: DataFrame containing backtest results
         """
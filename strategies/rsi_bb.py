@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+import bottleneck as bn
 from typing import Dict
 from .base import StrategyBase
 
@@ -36,37 +37,55 @@ class RSIBB(StrategyBase):
 
         :return: DataFrame with calculated RSI, Bollinger Bands, signals, and positions.
         """
-        df = self.price_data.copy()
+        close = np.ascontiguousarray(self.price_data['Close'].to_numpy(), dtype=np.float64)
 
-        delta = df['Close'].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        avg_gain = gain.rolling(self.rsi_period).mean()
-        avg_loss = loss.rolling(self.rsi_period).mean()
-        rs = avg_gain / avg_loss
-        df['RSI'] = 100 - (100 / (1 + rs))
+        delta = np.diff(close, prepend=np.nan)
+        # fmax maps the leading NaN delta to 0, so the first RSI window is still complete
+        gain = np.fmax(delta, 0.0)
+        loss = np.fmax(-delta, 0.0)
+        avg_gain = bn.move_mean(gain, window=self.rsi_period, min_count=self.rsi_period)
+        avg_loss = bn.move_mean(loss, window=self.rsi_period, min_count=self.rsi_period)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = avg_gain / avg_loss
+        rsi = 100 - (100 / (1 + rs))
 
-        df['BB_MA'] = df['Close'].rolling(self.bb_window).mean()
-        df['BB_Upper'] = df['BB_MA'] + self.bb_std * df['Close'].rolling(self.bb_window).std()
-        df['BB_Lower'] = df['BB_MA'] - self.bb_std * df['Close'].rolling(self.bb_window).std()
+        bb_ma = bn.move_mean(close, window=self.bb_window, min_count=self.bb_window)
+        bb_band = self.bb_std * bn.move_std(close, window=self.bb_window, min_count=self.bb_window, ddof=1)
+        bb_lower = bb_ma - bb_band
 
-        df['Signal'] = np.where((df['RSI'] < 30) & (df['Close'] < df['BB_Lower']), 1, 0)
-        df['Position'] = df['Signal'].diff()
+        signal = np.where((rsi < 30) & (close < bb_lower), 1, 0)
+        df = pd.DataFrame({
+            'Close': close,
+            'RSI': rsi,
+            'BB_Upper': bb_ma + bb_band,
+            'BB_Lower': bb_lower,
+            'Signal': signal,
+            'Position': np.diff(signal, prepend=np.nan)
+        }, index=self.price_data.index)
         df = df.dropna(subset=['RSI', 'BB_Lower', 'BB_Upper', 'Signal'])
 
         return df
 
-    def run_backtest(self) -> pd.DataFrame:
+    def _run_backtest(self) -> pd.DataFrame:
         """
-        Runs the backtest based on the generated signals. It calculates returns, strategy performance, 
+        Runs the backtest based on the generated signals. It calculates strategy performance 
         and equity over time.
 
-        :return: DataFrame with returns, strategy performance, and cumulative equity.
+        :return: DataFrame with strategy performance and cumulative equity.
         """
-        df = self.generate_signals()
-        df['Return'] = df['Close'].pct_change()
-        df['Strategy'] = df['Return'] * df['Position'].shift(1)
-        df['Equity'] = (1 + df['Strategy']).cumprod()
+        df = self._signals_df.copy()
+        close = df['Close'].to_numpy(dtype=np.float64)
+        position = df['Position'].to_numpy(dtype=np.float64)
+
+        strategy = np.full(close.shape[0], np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            strategy[1:] = (close[1:] / close[:-1] - 1) * position[:-1]
+        # Skip missing returns like Series.cumprod: they stay NaN and do not reset the curve
+        equity = np.nancumprod(1 + strategy)
+        equity[np.isnan(strategy)] = np.nan
+
+        df['Strategy'] = strategy
+        df['Equity'] = equity
         
         return df
 
@@ -77,7 +96,7 @@ class RSIBB(StrategyBase):
 
         :return: A dictionary with 'Total Return', 'Sharpe Ratio', and 'Max Drawdown' metrics.
         """
-        df = self.run_backtest()
+        df = self._backtest_df
         total_return = df['Equity'].iloc[-1] - 1
         
         if df['Strategy'].std() != 0:
@@ -1,6 +1,7 @@
+import itertools
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import Dict, Sequence
 from .base import StrategyBase
 import vectorbt as vbt
 
@@ -25,7 +26,8 @@ class SMACrossover(StrategyBase):
         """
         Initializes the SMACrossover strategy.
 
-        :param price_data: DataFrame containing historical price data.
+        :param price_data: DataFrame containing historical price data. To avoid reading every pair, 
+            load only the needed one with DataLoader.load_parquet(filename, symbol=symbol).
         :param symbol: The trading pair symbol (default is "ETHBTC").
         :param short_window: The window size for the short-term SMA.
         :param long_window: The window size for the long-term SMA.
@@ -42,28 +44,34 @@ class SMACrossover(StrategyBase):
     def generate_signals(self) -> pd.DataFrame:
         """
         Generates buy signals based on the crossover of the short-term and long-term SMAs, 
-        along with a volatility filter. A signal is generated when the short-term SMA crosses above 
-        the long-term SMA and the volatility is above the defined threshold.
+        along with a volatility filter. An entry is generated when the short-term SMA crosses above 
+        the long-term SMA and the volatility is above the defined threshold; an exit is generated 
+        when the short-term SMA crosses back below the long-term SMA.
 
-        :return: DataFrame with calculated SMAs, volatility, signals, and positions.
+        :return: DataFrame with calculated SMAs, volatility, entries, and exits.
         """
-        df = self.price_data.copy()
-
-        df['SMA_short'] = df['Close'].rolling(self.short_window).mean()
-        df['SMA_long'] = df['Close'].rolling(self.long_window).mean()
-
-        df['Volatility'] = df['Close'].pct_change().rolling(self.volatility_window).std()
-
-        df['Signal'] = np.where(
-            (df['SMA_short'] > df['SMA_long']) & (df['Volatility'] > self.volatility_threshold),
-            1, 0
+        close = pd.Series(
+            np.ascontiguousarray(self.price_data['Close'].to_numpy(), dtype=np.float64),
+            index=self.price_data.index,
+            name='Close'
         )
 
-        df['Position'] = df['Signal'].diff()
+        fast = vbt.MA.run(close, self.short_window, short_name='fast')
+        slow = vbt.MA.run(close, self.long_window, short_name='slow')
+        volatility = close.pct_change().vbt.rolling_std(self.volatility_window)
+
+        df = pd.DataFrame({
+            'Close': close,
+            'SMA_short': fast.ma.to_numpy(),
+            'SMA_long': slow.ma.to_numpy(),
+            'Volatility': volatility,
+            'Entry': fast.ma_crossed_above(slow).to_numpy() & (volatility > self.volatility_threshold).to_numpy(),
+            'Exit': fast.ma_crossed_below(slow).to_numpy()
+        }, index=close.index)
 
         return df
 
-    def run_backtest(self) -> pd.DataFrame:
+    def _run_backtest(self) -> vbt.Portfolio:
         """
          Run the backtest using vectorbt based on the strategy's generated signals.
 
@@ -73,16 +81,68 @@ class SMACrossover(StrategyBase):
         Returns:
             vbt.Portfolio: A vectorbt Portfolio object containing performance metrics, trades, equity curve, and more.
         """
-        df = self.generate_signals()
+        df = self._signals_df
         
         portfolio = vbt.Portfolio.from_signals(
             df['Close'],  
-            df['Signal'], 
-            df['Signal'].shift(-1),  
+            df['Entry'], 
+            df['Exit'],  
             freq='1T',  
         )
 
         return portfolio
-    
-    def get_metrics(self, cash: int = 10_000) -> Dict[str, float]:
-        pass
\ No newline at end of file
+
+    def run_backtest_grid(
+            self,
+            short_windows: Sequence[int],
+            long_windows: Sequence[int],
+            vol_thresholds: Sequence[float]
+        ) -> vbt.Portfolio:
+        """
+        Runs the backtest for every combination of short window, long window and volatility threshold 
+        in one vectorized pass. Each unique SMA window is computed once, and the volatility once, 
+        instead of rerunning the strategy per combination.
+
+        :param short_windows: The window sizes to try for the short-term SMA.
+        :param long_windows: The window sizes to try for the long-term SMA.
+        :param vol_thresholds: The volatility thresholds to try.
+        :return: A vectorbt Portfolio with one column per (short_window, long_window, volatility_threshold).
+        """
+        combos = list(itertools.product(short_windows, long_windows, vol_thresholds))
+        short_params, long_params, threshold_params = zip(*combos)
+
+        close = pd.Series(
+            np.ascontiguousarray(self.price_data['Close'].to_numpy(), dtype=np.float64),
+            index=self.price_data.index,
+            name='Close'
+        )
+
+        # MA caches the rolling mean per unique window, so repeated windows cost nothing extra
+        fast = vbt.MA.run(close, list(short_params), short_name='fast')
+        slow = vbt.MA.run(close, list(long_params), short_name='slow')
+        volatility = close.pct_change().vbt.rolling_std(self.volatility_window).to_numpy()
+
+        columns = pd.MultiIndex.from_tuples(
+            combos, names=['short_window', 'long_window', 'volatility_threshold']
+        )
+        active = volatility[:, None] > np.asarray(threshold_params)[None, :]
+        entries = pd.DataFrame(
+            fast.ma_crossed_above(slow).to_numpy() & active, index=close.index, columns=columns
+        )
+        exits = pd.DataFrame(fast.ma_crossed_below(slow).to_numpy(), index=close.index, columns=columns)
+
+        return vbt.Portfolio.from_signals(close, entries, exits, freq='1T')
+
+    def get_metrics(self) -> Dict[str, float]:
+        """
+        Calculates the key performance metrics of the strategy from the backtest portfolio: 
+        Total Return, Sharpe Ratio, and Maximum Drawdown.
+
+        :return: A dictionary with 'Total Return', 'Sharpe Ratio', and 'Max Drawdown' metrics.
+        """
+        portfolio = self._backtest_df
+        return {
+            "Total Return": portfolio.total_return(),
+            "Sharpe Ratio": portfolio.sharpe_ratio(),
+            "Max Drawdown": portfolio.max_drawdown()
+        }
\ No newline at end of file
@@ -31,30 +31,64 @@ class VWAPReversion(StrategyBase):
 
         :return: DataFrame with calculated VWAP, deviation, signals, and positions.
         """
-        df = self.price_data.copy()
+        close = np.ascontiguousarray(self.price_data['Close'].to_numpy(), dtype=np.float64)
+        volume = np.ascontiguousarray(self.price_data['Volume'].to_numpy(), dtype=np.float64)
 
-        df['CumVolume'] = df['Volume'].rolling(self.vwap_window).sum()
-        df['CumPV'] = (df['Close'] * df['Volume']).rolling(self.vwap_window).sum()
-        df['VWAP'] = df['CumPV'] / df['CumVolume']
+        cum_volume = self._window_sum(volume, self.vwap_window)
+        cum_pv = self._window_sum(close * volume, self.vwap_window)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vwap = cum_pv / cum_volume
+            deviation = (vwap - close) / vwap
+        signal = np.where(deviation > self.threshold, 1, 0)
 
-        df['Deviation'] = (df['VWAP'] - df['Close']) / df['VWAP']
-        df['Signal'] = np.where(df['Deviation'] > self.threshold, 1, 0)
-        df['Position'] = df['Signal'].diff()
+        df = pd.DataFrame({
+            'Close': close,
+            'CumVolume': cum_volume,
+            'CumPV': cum_pv,
+            'VWAP': vwap,
+            'Deviation': deviation,
+            'Signal': signal,
+            'Position': np.diff(signal, prepend=np.nan)
+        }, index=self.price_data.index)
 
         return df
 
-    def run_backtest(self) -> pd.DataFrame:
+    @staticmethod
+    def _window_sum(values: np.ndarray, window: int) -> np.ndarray:
+        """
+        Calculates the rolling sum over the given window as the difference of the running sum and 
+        its value window steps earlier. The first window - 1 values are NaN.
+
+        :param values: 1-D array of values without gaps (NaN).
+        :param window: The window size.
+        :return: Array of rolling sums of the same length as values.
+        """
+        cumsum = np.cumsum(values, dtype=np.float64)
+        result = np.full(cumsum.shape[0], np.nan)
+        if window <= cumsum.shape[0]:
+            result[window - 1:] = cumsum[window - 1:]
+            result[window:] -= cumsum[:-window]
+        return result
+
+    def _run_backtest(self) -> pd.DataFrame:
         """
         Runs a backtest based on the generated signals. It calculates the strategy's returns and 
         cumulative equity.
 
         :return: DataFrame with the strategy's performance, including returns and equity.
         """
-        df = self.generate_signals()
-        df['Return'] = df['Close'].pct_change()
-        df['Strategy'] = df['Return'] * df['Position'].shift(1)
-        df['Strategy'] = df['Strategy'].fillna(0) 
-        df['Equity'] = (1 + df['Strategy']).cumprod()
+        df = self._signals_df.copy()
+        close = df['Close'].to_numpy(dtype=np.float64)
+        position = df['Position'].to_numpy(dtype=np.float64)
+
+        strategy = np.zeros(close.shape[0])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = (close[1:] / close[:-1] - 1) * position[:-1]
+        # Fill only missing returns, like fillna(0); a zero close still yields inf
+        strategy[1:] = np.where(np.isnan(returns), 0.0, returns)
+
+        df['Strategy'] = strategy
+        df['Equity'] = np.cumprod(1 + strategy)
 
         return df
 
@@ -65,7 +99,7 @@ class VWAPReversion(StrategyBase):
 
         :return: A dictionary with Total Return, Sharpe Ratio, and Maximum Drawdown metrics.
         """
-        df = self.run_backtest()
+        df = self._backtest_df
         total_return = df['Equity'].iloc[-1] - 1
         
         if df['Strategy'].std() != 0:
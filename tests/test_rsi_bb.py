@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategies.rsi_bb import RSIBB
+
+
+def make_price_data(price_level: float, n: int = 40_000) -> pd.DataFrame:
+    """Random-walk minute bars stored as float32, like DataLoader.load_parquet returns them."""
+    rng = np.random.default_rng(0)
+    close = price_level * np.exp(np.cumsum(rng.normal(0, 1e-3, n)))
+    index = pd.date_range('2025-02-01', periods=n, freq='1min', tz='UTC', name='Open time')
+    return pd.DataFrame({'Close': close, 'Volume': rng.uniform(1, 100, n)}, index=index).astype(np.float32)
+
+
+def pandas_reference(close: pd.Series, rsi_period: int, bb_window: int, bb_std: float) -> pd.DataFrame:
+    """RSI and Bollinger Bands computed with pandas rolling windows in float64."""
+    close = close.astype(np.float64)
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    rs = gain.rolling(rsi_period).mean() / loss.rolling(rsi_period).mean()
+    bb_ma = close.rolling(bb_window).mean()
+    bb_band = bb_std * close.rolling(bb_window).std()
+    return pd.DataFrame({
+        'RSI': 100 - (100 / (1 + rs)),
+        'BB_Upper': bb_ma + bb_band,
+        'BB_Lower': bb_ma - bb_band
+    })
+
+
+@pytest.mark.parametrize('price_level', [0.03, 2.5e-5])
+def test_float32_input_matches_pandas_float64(price_level):
+    price_data = make_price_data(price_level)
+    strategy = RSIBB(price_data)
+
+    df = strategy.generate_signals()
+    expected = pandas_reference(
+        price_data['Close'], strategy.rsi_period, strategy.bb_window, strategy.bb_std
+    ).loc[df.index]
+
+    for column in ['RSI', 'BB_Upper', 'BB_Lower']:
+        np.testing.assert_allclose(df[column], expected[column], rtol=1e-6)
+    expected_signal = (expected['RSI'] < 30) & (df['Close'] < expected['BB_Lower'])
+    np.testing.assert_array_equal(df['Signal'], expected_signal.astype(int))